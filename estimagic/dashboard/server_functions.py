@@ -1,7 +1,5 @@
 """Functions for setting up and running the BokehServer displaying the dashboard."""
 import asyncio
-import socket
-from contextlib import closing
 from functools import partial
 from multiprocessing import Process
 
@@ -65,7 +63,7 @@ def run_server(queue, stop_signal, db_options, start_param_df, start_fitness):
 def _process_db_options(db_options):
     db_options = db_options.copy()
 
-    port = db_options.pop("port", _find_free_port())
+    port = db_options.pop("port", 0)
     no_browser = db_options.pop("no_browser", False)
 
     if db_options.get("rollover", 1) <= 0:
@@ -79,18 +77,6 @@ def _process_db_options(db_options):
     return full_db_options, port, no_browser
 
 
-def _find_free_port():
-    """
-    Find a free port on the localhost.
-
-    Adapted from https://stackoverflow.com/a/45690594
-    """
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("localhost", 0))
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
-
-
 def _setup_server(apps, port, no_browser):
     """
     Setup the server similarly to bokeh serve subcommand.
@@ -101,7 +87,8 @@ def _setup_server(apps, port, no_browser):
 
     Args:
         apps (dict): Dictionary mapping suffixes of the address to Applications.
-        port (int): Port where to host the BokehServer.
+        port (int): Port where to host the BokehServer. If 0, the operating system
+            picks a free port when the server binds its socket.
         no_browser (bool): Whether to open the dashboard in the browser. Defaults to
             false. Has to be set to ``True`` for running on a remote server.
 
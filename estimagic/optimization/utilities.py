@@ -1,16 +1,22 @@
+import functools
+import math
 import warnings
 from collections import namedtuple
 
 import numpy as np
-from fuzzywuzzy import process as fw_process
+from rapidfuzz import fuzz
+from rapidfuzz import process as fw_process
+from rapidfuzz import utils as fw_utils
 from scipy.linalg import ldl
 from scipy.linalg import qr
+from scipy.linalg.lapack import dpotrf
 
 
 def chol_params_to_lower_triangular_matrix(params):
-    dim = number_of_triangular_elements_to_dimension(len(params))
+    dim = _dimension_from_triangular_params(params)
     mat = np.zeros((dim, dim))
-    mat[np.tril_indices(dim)] = params
+    lower, _ = _flat_tril_indices(dim)
+    np.put(mat, lower, params)
     return mat
 
 
@@ -25,33 +31,38 @@ def cov_params_to_matrix(cov_params):
         cov (np.array): a covariance matrix
 
     """
-    lower = chol_params_to_lower_triangular_matrix(cov_params)
-    cov = lower + np.tril(lower, k=-1).T
+    dim = _dimension_from_triangular_params(cov_params)
+    lower, upper = _flat_tril_indices(dim)
+    cov = np.empty((dim, dim))
+    np.put(cov, lower, cov_params)
+    np.put(cov, upper, cov_params)
     return cov
 
 
 def cov_matrix_to_params(cov):
-    return cov[np.tril_indices(len(cov))]
+    lower, _ = _flat_tril_indices(len(cov))
+    return np.take(cov, lower)
 
 
 def sdcorr_params_to_sds_and_corr(sdcorr_params):
-    dim = number_of_triangular_elements_to_dimension(len(sdcorr_params))
+    dim = _dimension_from_triangular_params(sdcorr_params)
     sds = np.array(sdcorr_params[:dim])
+    lower, upper = _flat_tril_indices(dim, k=-1)
     corr = np.eye(dim)
-    corr[np.tril_indices(dim, k=-1)] = sdcorr_params[dim:]
-    corr += np.tril(corr, k=-1).T
+    correlations = sdcorr_params[dim:]
+    np.put(corr, lower, correlations)
+    np.put(corr, upper, correlations)
     return sds, corr
 
 
 def sds_and_corr_to_cov(sds, corr):
-    diag = np.diag(sds)
-    return diag @ corr @ diag
+    return corr * np.multiply.outer(sds, sds)
 
 
 def cov_to_sds_and_corr(cov):
     sds = np.sqrt(np.diagonal(cov))
-    diag = np.diag(1 / sds)
-    corr = diag @ cov @ diag
+    inv_sds = 1 / sds
+    corr = cov * np.multiply.outer(inv_sds, inv_sds)
     return sds, corr
 
 
@@ -68,13 +79,24 @@ def sdcorr_params_to_matrix(sdcorr_params):
         cov (np.array): a covariance matrix
 
     """
-    return sds_and_corr_to_cov(*sdcorr_params_to_sds_and_corr(sdcorr_params))
+    sdcorr_params = np.asarray(sdcorr_params, dtype=float)
+    dim = _dimension_from_triangular_params(sdcorr_params)
+    sds = sdcorr_params[:dim]
+    rows, cols = _tril_indices(dim, k=-1)
+    cov = np.empty((dim, dim))
+    np.fill_diagonal(cov, sds ** 2)
+    covariances = sdcorr_params[dim:] * sds[rows] * sds[cols]
+    lower, upper = _flat_tril_indices(dim, k=-1)
+    np.put(cov, lower, covariances)
+    np.put(cov, upper, covariances)
+    return cov
 
 
 def cov_matrix_to_sdcorr_params(cov):
     dim = len(cov)
     sds, corr = cov_to_sds_and_corr(cov)
-    correlations = corr[np.tril_indices(dim, k=-1)]
+    lower, _ = _flat_tril_indices(dim, k=-1)
+    correlations = np.take(corr, lower)
     return np.hstack([sds, correlations])
 
 
@@ -91,7 +113,7 @@ def number_of_triangular_elements_to_dimension(num):
         4
 
     """
-    return int(np.sqrt(8 * num + 1) / 2 - 0.5)
+    return (int(math.sqrt(8 * num + 1)) - 1) // 2
 
 
 def dimension_to_number_of_triangular_elements(dim):
@@ -101,7 +123,48 @@ def dimension_to_number_of_triangular_elements(dim):
         dim (int): Dimension of a square matrix.
 
     """
-    return int(dim * (dim + 1) / 2)
+    return int(dim * (dim + 1) // 2)
+
+
+def _dimension_from_triangular_params(params):
+    """Dimension of the square matrix described by *params*.
+
+    Raises:
+        ValueError if the length of params is not a triangular number.
+
+    """
+    dim = number_of_triangular_elements_to_dimension(len(params))
+    if dimension_to_number_of_triangular_elements(dim) != len(params):
+        raise ValueError(
+            "Invalid number of parameters for a square matrix: {}".format(len(params))
+        )
+    return dim
+
+
+@functools.lru_cache(maxsize=None)
+def _tril_indices(dim, k=0):
+    """Cached and read-only version of np.tril_indices."""
+    rows, cols = np.tril_indices(dim, k=k)
+    rows.flags.writeable = False
+    cols.flags.writeable = False
+    return rows, cols
+
+
+@functools.lru_cache(maxsize=None)
+def _flat_tril_indices(dim, k=0):
+    """Cached flat indices of the lower triangle and of its mirror image.
+
+    The first array contains the positions of the lower triangular elements in the
+    flattened (C-order) matrix, the second the positions of the corresponding
+    elements in the upper triangle. They can be used with np.put and np.take.
+
+    """
+    rows, cols = _tril_indices(dim, k=k)
+    lower = rows * dim + cols
+    upper = cols * dim + rows
+    lower.flags.writeable = False
+    upper.flags.writeable = False
+    return lower, upper
 
 
 def index_element_to_string(element, separator="_"):
@@ -133,13 +196,39 @@ def propose_algorithms(requested_algo, algos, number=3):
         ['scipy_L-BFGS-B', 'nlopt_lbfgsb']
 
     """
-    possibilities = [
+    possibilities = tuple(
         "_".join([origin, algo_name]) for origin in algos for algo_name in algos[origin]
-    ]
-    proposals_w_probs = fw_process.extract(requested_algo, possibilities, limit=number)
-    proposals = [proposal[0] for proposal in proposals_w_probs]
+    )
+    if requested_algo in possibilities:
+        # An exact match is always the best proposal and needs no fuzzy scoring.
+        proposals = [requested_algo]
+        if number > 1:
+            others = _propose_algorithms_cached(requested_algo, possibilities, number)
+            proposals += [algo for algo in others if algo != requested_algo]
+        return proposals[:number]
+
+    proposals = _propose_algorithms_cached(requested_algo, possibilities, number)
+
+    return list(proposals)
+
+
+@functools.lru_cache(maxsize=256)
+def _propose_algorithms_cached(requested_algo, possibilities, number):
+    """Cached fuzzy matching of *requested_algo* against a tuple of possibilities."""
+    proposals_w_probs = fw_process.extract(
+        fw_utils.default_process(requested_algo),
+        _process_possibilities(possibilities),
+        scorer=fuzz.WRatio,
+        processor=None,
+        limit=number,
+    )
+    return tuple(possibilities[proposal[2]] for proposal in proposals_w_probs)
+
 
-    return proposals
+@functools.lru_cache(maxsize=32)
+def _process_possibilities(possibilities):
+    """Normalize the possibilities once instead of on every fuzzy match."""
+    return tuple(fw_utils.default_process(possibility) for possibility in possibilities)
 
 
 def robust_cholesky(matrix, threshold=None, warn=True, return_info=False):
@@ -180,10 +269,12 @@ def robust_cholesky(matrix, threshold=None, warn=True, return_info=False):
 
 
     """
-    sum_stabilized = 0.0
-
     try:
-        chol = np.linalg.cholesky(matrix)
+        # dpotrf is the LAPACK routine behind np.linalg.cholesky. Calling it directly
+        # skips numpy's wrapper overhead; the input is still copied by f2py.
+        chol, info = dpotrf(matrix, lower=True, clean=True)
+        if info != 0:
+            raise np.linalg.LinAlgError("Matrix is not positive definite.")
         method = "np.linalg.cholesky"
         diags = np.diagonal(chol) ** 2
     except np.linalg.LinAlgError:
@@ -194,18 +285,16 @@ def robust_cholesky(matrix, threshold=None, warn=True, return_info=False):
 
         diags = np.diagonal(d).copy()
 
-        for i in range(len(diags)):
-            if diags[i] >= 0:
-                diags[i] = np.sqrt(diags[i])
-            elif diags[i] > threshold:
-                diags[i] = 0
-                sum_stabilized += diags[i]
-            else:
-                raise np.linalg.LinAlgError(
-                    "Diagonal entry below threshold in D from LDL decomposition."
-                )
-
-        if sum_stabilized < 0 and warn:
+        negative = diags < 0
+        if (negative & (diags <= threshold)).any():
+            raise np.linalg.LinAlgError(
+                "Diagonal entry below threshold in D from LDL decomposition."
+            )
+
+        diags[negative] = 0
+        np.sqrt(diags, out=diags)
+
+        if negative.any() and warn:
             warnings.warn(
                 "Negative diagonal entry has been set to 0 in robust_cholesky.",
                 category=RuntimeWarning,
@@ -213,13 +302,13 @@ def robust_cholesky(matrix, threshold=None, warn=True, return_info=False):
 
         candidate = lu * diags.reshape(1, len(diags))
 
-        is_triangular = (candidate[np.triu_indices(len(matrix), k=1)] == 0).all()
+        is_triangular = not np.triu(candidate, k=1).any()
 
         if is_triangular:
             chol = candidate
             method = "LDL cholesky"
         else:
-            _, r = qr(candidate.T)
+            (r,) = qr(candidate.T, mode="r", check_finite=False)
             chol = r.T
             method = "LDL cholesky with QR decomposition"
 
@@ -237,7 +326,7 @@ def namedtuple_from_dict(field_dict):
         NamedTuple(a=1, b=2)
 
     """
-    return namedtuple("NamedTuple", field_dict)(**field_dict)
+    return _namedtuple_class(tuple(field_dict))(**field_dict)
 
 
 def namedtuple_from_kwargs(**kwargs):
@@ -248,7 +337,7 @@ def namedtuple_from_kwargs(**kwargs):
         NamedTuple(a=1, b=2)
 
     """
-    return namedtuple("NamedTuple", kwargs)(**kwargs)
+    return _namedtuple_class(tuple(kwargs))(**kwargs)
 
 
 def namedtuple_from_iterables(field_names, field_entries):
@@ -259,4 +348,12 @@ def namedtuple_from_iterables(field_names, field_entries):
         NamedTuple(a=1, b=2)
 
     """
-    return namedtuple("NamedTuple", field_names)(*field_entries)
+    if isinstance(field_names, str):
+        field_names = field_names.replace(",", " ").split()
+    return _namedtuple_class(tuple(field_names))(*field_entries)
+
+
+@functools.lru_cache(maxsize=256)
+def _namedtuple_class(field_names):
+    """Cached namedtuple class, so it is not rebuilt for the same field names."""
+    return namedtuple("NamedTuple", field_names)
@@ -14,32 +14,43 @@ from estimagic.optimization.reparametrize import reparametrize_from_internal
 from estimagic.optimization.reparametrize import reparametrize_to_internal
 
 fix_path = Path(__file__).resolve().parent / "fixtures" / "reparametrize_fixtures.csv"
-params_fixture = pd.read_csv(fix_path)
-params_fixture.set_index(["category", "subcategory", "name"], inplace=True)
-for col in ["lower", "internal_lower"]:
-    params_fixture[col].fillna(-np.inf, inplace=True)
-for col in ["upper", "internal_upper"]:
-    params_fixture[col].fillna(np.inf, inplace=True)
+fill_values = {
+    "lower": -np.inf,
+    "internal_lower": -np.inf,
+    "upper": np.inf,
+    "internal_upper": np.inf,
+}
+params_fixture = pd.read_csv(
+    fix_path, index_col=["category", "subcategory", "name"]
+).fillna(fill_values)
 
 external = []
 internal = []
 
 for i in range(3):
-    ext = params_fixture.copy(deep=True)
-    ext.rename(columns={"value{}".format(i): "value"}, inplace=True)
+    ext = params_fixture.rename(columns={"value{}".format(i): "value"})
     external.append(ext)
 
-    int_ = params_fixture.copy(deep=True)
-    int_.rename(columns={"internal_value{}".format(i): "value"}, inplace=True)
-    int_.dropna(subset=["value"], inplace=True)
-    int_.drop(columns=["lower", "upper"], inplace=True)
-    int_.rename(
-        columns={"internal_lower": "lower", "internal_upper": "upper"}, inplace=True
+    int_ = (
+        params_fixture.rename(columns={"internal_value{}".format(i): "value"})
+        .dropna(subset=["value"])
+        .drop(columns=["lower", "upper"])
+        .rename(columns={"internal_lower": "lower", "internal_upper": "upper"})
     )
     internal.append(int_)
 
 
+# The params DataFrames above live for the whole module, so their ids are stable.
+_processed_constraints = {}
+
+
 def constraints(params):
+    if id(params) not in _processed_constraints:
+        _processed_constraints[id(params)] = _constraints(params)
+    return _processed_constraints[id(params)]
+
+
+def _constraints(params):
     constr = [
         {"loc": ("c", "c2"), "type": "probability"},
         {
@@ -68,14 +79,15 @@ def constraints(params):
 internal_categories = list("abcdefghikm")
 external_categories = internal_categories + ["j1", "j2", "l"]
 
-to_test = []
-for ext, int_ in zip(external, internal):
-    for category in internal_categories:
-        to_test.append((ext, int_, category))
 
+@pytest.fixture(scope="module", params=range(3))
+def external_and_internal(request):
+    return external[request.param], internal[request.param]
 
-@pytest.mark.parametrize("params, expected_internal, category", to_test)
-def test_reparametrize_to_internal(params, expected_internal, category):
+
+@pytest.mark.parametrize("category", internal_categories)
+def test_reparametrize_to_internal(external_and_internal, category):
+    params, expected_internal = external_and_internal
     constr = constraints(params)
     cols = ["value", "lower", "upper"]
 
@@ -85,14 +97,9 @@ def test_reparametrize_to_internal(params, expected_internal, category):
     )
 
 
-to_test = []
-for int_, ext in zip(internal, external):
-    for category in external_categories:
-        to_test.append((int_, ext, category))
-
-
-@pytest.mark.parametrize("internal, expected_external, category", to_test)
-def test_reparametrize_from_internal(internal, expected_external, category):
+@pytest.mark.parametrize("category", external_categories)
+def test_reparametrize_from_internal(external_and_internal, category):
+    expected_external, internal = external_and_internal
     constr = constraints(expected_external)
 
     calculated = reparametrize_from_internal(internal, constr, expected_external, None)[
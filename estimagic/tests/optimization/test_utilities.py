@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -10,7 +13,11 @@ from estimagic.optimization.utilities import cov_params_to_matrix
 from estimagic.optimization.utilities import cov_to_sds_and_corr
 from estimagic.optimization.utilities import dimension_to_number_of_triangular_elements
 from estimagic.optimization.utilities import index_element_to_string
+from estimagic.optimization.utilities import namedtuple_from_dict
+from estimagic.optimization.utilities import namedtuple_from_iterables
+from estimagic.optimization.utilities import namedtuple_from_kwargs
 from estimagic.optimization.utilities import number_of_triangular_elements_to_dimension
+from estimagic.optimization.utilities import propose_algorithms
 from estimagic.optimization.utilities import robust_cholesky
 from estimagic.optimization.utilities import sdcorr_params_to_matrix
 from estimagic.optimization.utilities import sdcorr_params_to_sds_and_corr
@@ -83,6 +90,20 @@ def test_cov_to_sds_and_corr():
     aaae(calc_corr, exp_corr)
 
 
+@pytest.mark.parametrize(
+    "func",
+    [
+        chol_params_to_lower_triangular_matrix,
+        cov_params_to_matrix,
+        sdcorr_params_to_sds_and_corr,
+        sdcorr_params_to_matrix,
+    ],
+)
+def test_params_to_matrix_with_invalid_number_of_params(func):
+    with pytest.raises(ValueError):
+        func(np.arange(1.0, 5.0))
+
+
 def test_number_of_triangular_elements_to_dimension():
     inputs = [6, 10, 15, 21]
     expected = [3, 4, 5, 6]
@@ -97,6 +118,10 @@ def test_dimension_to_number_of_triangular_elements():
         assert dimension_to_number_of_triangular_elements(inp) == exp
 
 
+def test_dimension_to_number_of_triangular_elements_returns_int():
+    assert type(dimension_to_number_of_triangular_elements(3.0)) is int
+
+
 def test_index_element_to_string():
     inputs = [(("a", "b", 1),), (["bla", 5, 6], "~"), ("bla", "*")]
     expected = ["a_b_1", "bla~5~6", "bla"]
@@ -104,6 +129,45 @@ def test_index_element_to_string():
         assert index_element_to_string(*inp) == exp
 
 
+algo_dict_path = Path(__file__).resolve().parents[2] / "optimization" / "algo_dict.json"
+
+typos_and_proposals = [
+    ("lbfgsb", ["nlopt_lbfgs", "scipy_L-BFGS-B", "nlopt_auglag"]),
+    ("nelder-mead", ["nlopt_neldermead", "nlopt_mma", "pygmo_moead"]),
+    ("bobyqa", ["nlopt_bobyqa", "nlopt_cobyla", "nlopt_newuoa"]),
+    ("slsqp", ["nlopt_slsqp", "scipy_SLSQP", "scipy_L-BFGS-B"]),
+    ("scipy_tnc", ["scipy_TNC", "scipy_L-BFGS-B", "scipy_SLSQP"]),
+]
+
+
+@pytest.mark.parametrize("requested_algo, expected", typos_and_proposals)
+def test_propose_algorithms_for_typos(requested_algo, expected):
+    with open(algo_dict_path) as j:
+        algos = json.load(j)
+    assert propose_algorithms(requested_algo, algos) == expected
+
+
+def test_propose_algorithms_with_exact_match_and_several_proposals():
+    algos = {"scipy": ["L-BFGS-B", "TNC"], "nlopt": ["lbfgsb"]}
+    calculated = propose_algorithms("scipy_L-BFGS-B", algos, number=3)
+    assert calculated[0] == "scipy_L-BFGS-B"
+    assert sorted(calculated[1:]) == ["nlopt_lbfgsb", "scipy_TNC"]
+
+
+def test_namedtuple_class_is_reused():
+    from_dict = namedtuple_from_dict({"a": 1, "b": 2})
+    from_kwargs = namedtuple_from_kwargs(a=3, b=4)
+    from_iterables = namedtuple_from_iterables(["a", "b"], [5, 6])
+    assert type(from_dict) is type(from_kwargs) is type(from_iterables)
+
+
+@pytest.mark.parametrize("field_names", ["a b", "a, b", "a,b"])
+def test_namedtuple_from_iterables_with_string_field_names(field_names):
+    calculated = namedtuple_from_iterables(field_names, [1, 2])
+    assert calculated._fields == ("a", "b")
+    assert calculated == (1, 2)
+
+
 def random_cov(dim, seed):
     num_elements = int(dim * (dim + 1) / 2)
     chol = np.zeros((dim, dim))
@@ -132,3 +196,33 @@ def test_robust_cholesky_with_extreme_cases():
     for cov in [np.ones((5, 5)), np.zeros((5, 5))]:
         chol = robust_cholesky(cov)
         aaae(chol.dot(chol.T), cov)
+
+
+def test_robust_cholesky_falls_back_to_ldl_for_singular_matrix():
+    cov = np.ones((3, 3))
+    chol, info = robust_cholesky(cov, return_info=True)
+    assert info["method"] == "LDL cholesky"
+    aaae(chol.dot(chol.T), cov)
+
+
+def test_robust_cholesky_warns_about_stabilized_diagonal():
+    cov = np.diag([1, -1e-20])
+    with pytest.warns(RuntimeWarning):
+        chol = robust_cholesky(cov)
+    aaae(chol, np.diag([1, 0]))
+
+
+def test_robust_cholesky_with_entry_below_threshold():
+    cov = np.diag([1, -1e-3])
+    with pytest.raises(np.linalg.LinAlgError):
+        robust_cholesky(cov)
+
+
+def test_robust_cholesky_with_qr_decomposition():
+    np.random.seed(4)
+    factor = np.random.normal(size=(4, 2))
+    cov = factor @ factor.T
+    chol, info = robust_cholesky(cov, warn=False, return_info=True)
+    assert info["method"] == "LDL cholesky with QR decomposition"
+    aaae(chol.dot(chol.T), cov)
+    assert (chol[np.triu_indices(len(cov), k=1)] == 0).all()